@@ -22,14 +22,33 @@ CREATE TABLE IF NOT EXISTS Employee (
 );
 
 -- Attendance Table
+-- Partitioned by month on Date so date-bounded queries only touch the matching months and old
+-- months can be dropped whole. MySQL needs Date in every unique key and allows no foreign keys
+-- on partitioned tables: the backend checks EmployeeID before writing instead.
+-- `python manage.py attendance-partitions` adds upcoming months (splitting pmax) and archives old ones.
 CREATE TABLE IF NOT EXISTS Attendance (
-    AttendanceID INT AUTO_INCREMENT PRIMARY KEY,
+    AttendanceID INT AUTO_INCREMENT,
     EmployeeID INT NOT NULL,
     Date DATE NOT NULL,
     timeIn TIME,
     timeOut TIME,
-    FOREIGN KEY (EmployeeID) REFERENCES Employee(EmployeeID),
+    PRIMARY KEY (AttendanceID, Date),
     UNIQUE(EmployeeID, Date)
+)
+PARTITION BY RANGE COLUMNS(Date) (
+    PARTITION p202501 VALUES LESS THAN ('2025-02-01'),
+    PARTITION p202502 VALUES LESS THAN ('2025-03-01'),
+    PARTITION p202503 VALUES LESS THAN ('2025-04-01'),
+    PARTITION p202504 VALUES LESS THAN ('2025-05-01'),
+    PARTITION p202505 VALUES LESS THAN ('2025-06-01'),
+    PARTITION p202506 VALUES LESS THAN ('2025-07-01'),
+    PARTITION p202507 VALUES LESS THAN ('2025-08-01'),
+    PARTITION p202508 VALUES LESS THAN ('2025-09-01'),
+    PARTITION p202509 VALUES LESS THAN ('2025-10-01'),
+    PARTITION p202510 VALUES LESS THAN ('2025-11-01'),
+    PARTITION p202511 VALUES LESS THAN ('2025-12-01'),
+    PARTITION p202512 VALUES LESS THAN ('2026-01-01'),
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
 );
 
 -- Payroll Table
@@ -43,6 +62,36 @@ CREATE TABLE IF NOT EXISTS Payroll (
     FOREIGN KEY (EmployeeID) REFERENCES Employee(EmployeeID)
 );
 
+-- Department payroll rollup per pay month (maintained by the backend on every Payroll write;
+-- `python manage.py rebuild-payroll-rollup` recomputes it from Payroll)
+CREATE TABLE IF NOT EXISTS DepartmentPayrollMonthly (
+    DepartmentID INT NOT NULL,
+    PayMonth DATE NOT NULL,
+    Headcount INT NOT NULL DEFAULT 0,
+    GrossTotal DECIMAL(17,2) NOT NULL DEFAULT 0,
+    BonusTotal DECIMAL(17,2) NOT NULL DEFAULT 0,
+    DeductionTotal DECIMAL(17,2) NOT NULL DEFAULT 0,
+    NetTotal DECIMAL(17,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (DepartmentID, PayMonth)
+);
+
+-- Worked seconds per employee and month, summed from Attendance (TIMEDIFF(timeOut, timeIn));
+-- `python manage.py worked-hours` keeps it current and checks/prefills PerformanceReview.WorkingHours
+CREATE TABLE IF NOT EXISTS EmployeeWorkedMonthly (
+    EmployeeID INT NOT NULL,
+    WorkMonth DATE NOT NULL,
+    WorkedSeconds INT NOT NULL DEFAULT 0,
+    DaysWorked INT NOT NULL DEFAULT 0,
+    CountedThrough DATE NOT NULL,
+    PRIMARY KEY (EmployeeID, WorkMonth)
+);
+
+-- Months whose Attendance was written through the API since the last worked-hours run;
+-- the next incremental run recounts them whole and empties the table
+CREATE TABLE IF NOT EXISTS AttendanceRecount (
+    WorkMonth DATE PRIMARY KEY
+);
+
 -- Performance Review Table
 CREATE TABLE IF NOT EXISTS PerformanceReview (
     ReviewID INT AUTO_INCREMENT PRIMARY KEY,
@@ -71,6 +120,28 @@ CREATE TABLE IF NOT EXISTS UserAccount (
     FOREIGN KEY (adminID) REFERENCES `Admin`(AdminID)
 );
 
+-- Background jobs (payroll runs, PDF reports) submitted through the API.
+-- ActiveType = JobType while queued/running and NULL afterwards; its unique key allows
+-- at most one active job per type across all API processes.
+CREATE TABLE IF NOT EXISTS Job (
+    JobID CHAR(32) PRIMARY KEY,
+    JobType VARCHAR(50) NOT NULL,
+    ActiveType VARCHAR(50) NULL UNIQUE,
+    Status VARCHAR(20) NOT NULL,
+    Params TEXT,
+    Progress INT NOT NULL DEFAULT 0,
+    Message VARCHAR(255),
+    Error TEXT,
+    Result LONGBLOB,
+    ResultType VARCHAR(100),
+    CreatedBy VARCHAR(50),
+    CreatedAt DATETIME NOT NULL,
+    StartedAt DATETIME,
+    FinishedAt DATETIME,
+    HeartbeatAt DATETIME NOT NULL,
+    INDEX ix_job_type_created (JobType, CreatedAt)
+);
+
 USE HRIS;
 
 -- Insert Departments
@@ -218,6 +289,25 @@ INSERT INTO Payroll (EmployeeID, Salary, Bonus, Deduction, PayDate) VALUES
 (8, 18000000, 0, 0, '2025-05-31'),
 (9, 17000000, 0, 1000000, '2025-05-31');
 
+-- Backfill the department payroll rollup from the sample payroll
+INSERT INTO DepartmentPayrollMonthly
+    (DepartmentID, PayMonth, Headcount, GrossTotal, BonusTotal, DeductionTotal, NetTotal)
+SELECT e.DepartmentID, DATE_FORMAT(p.PayDate, '%Y-%m-01'), COUNT(DISTINCT p.EmployeeID),
+       SUM(p.Salary), SUM(COALESCE(p.Bonus, 0)), SUM(COALESCE(p.Deduction, 0)),
+       SUM(p.Salary + COALESCE(p.Bonus, 0) - COALESCE(p.Deduction, 0))
+FROM Payroll p
+JOIN Employee e ON e.EmployeeID = p.EmployeeID
+WHERE e.DepartmentID IS NOT NULL
+GROUP BY e.DepartmentID, DATE_FORMAT(p.PayDate, '%Y-%m-01');
+
+-- Backfill worked seconds from the sample attendance, through yesterday
+INSERT INTO EmployeeWorkedMonthly (EmployeeID, WorkMonth, WorkedSeconds, DaysWorked, CountedThrough)
+SELECT EmployeeID, DATE_FORMAT(Date, '%Y-%m-01'), SUM(TIME_TO_SEC(TIMEDIFF(timeOut, timeIn))), COUNT(*),
+       CURDATE() - INTERVAL 1 DAY
+FROM Attendance
+WHERE timeOut > timeIn AND Date < CURDATE()
+GROUP BY EmployeeID, DATE_FORMAT(Date, '%Y-%m-01');
+
 -- Sample Performance Reviews (for Q1 2025)
 INSERT INTO PerformanceReview (EmployeeID, ReviewDate, Score, Comments, WorkingHours) VALUES
 (1, '2025-03-31', 8, 'Good performance, met all deadlines.', 480),
@@ -269,25 +359,40 @@ BEGIN
 END$$
 DELIMITER ;
 
+-- Change counter per table behind the API's response cache and ETags. The backend bumps a row
+-- right after every write it commits. Plain SQL writes don't bump it: cached bodies expire after
+-- HRIS_RESPONSE_CACHE_TTL_SECONDS, but ETags stay valid until the next bump.
+CREATE TABLE IF NOT EXISTS TableVersion (
+    TableName VARCHAR(64) PRIMARY KEY,
+    Version BIGINT NOT NULL DEFAULT 0
+);
+
+-- Audit trail written by the backend: every create/update/delete through the API is logged with the
+-- acting UserAccount and a JSON diff {column: [before, after]}, batched into multi-row INSERTs
+-- outside the request's transaction. (Replaces trg_audit_employee_update, which logged only
+-- Employee updates, with no user, inside every UPDATE.)
+-- Upgrading an existing database:
+--   DROP TRIGGER IF EXISTS trg_audit_employee_update;
+--   ALTER TABLE AuditLog MODIFY TableName VARCHAR(50) NOT NULL, MODIFY ActionType VARCHAR(20) NOT NULL,
+--       MODIFY ActionTime DATETIME NOT NULL, ADD COLUMN RecordID VARCHAR(64) AFTER ActionType,
+--       ADD COLUMN Changes TEXT AFTER PerformedBy,
+--       ADD INDEX ix_audit_record (TableName, RecordID, LogID), ADD INDEX ix_audit_table (TableName, LogID),
+--       ADD INDEX ix_audit_user (PerformedBy, LogID), ADD INDEX ix_audit_time (ActionTime);
 CREATE TABLE IF NOT EXISTS AuditLog (
     LogID INT AUTO_INCREMENT PRIMARY KEY,
-    TableName VARCHAR(50),
-    ActionType VARCHAR(20),
-    ActionTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    PerformedBy INT, -- Can be tied to UserID or AdminID
-    Description TEXT
+    TableName VARCHAR(50) NOT NULL,
+    ActionType VARCHAR(20) NOT NULL, -- INSERT | UPDATE | DELETE
+    RecordID VARCHAR(64), -- primary key of the changed row; NULL for bulk summaries
+    ActionTime DATETIME NOT NULL, -- when the change happened (rows are written up to a second later)
+    PerformedBy INT, -- UserAccount.UserID
+    Changes TEXT, -- JSON
+    Description TEXT,
+    INDEX ix_audit_record (TableName, RecordID, LogID),
+    INDEX ix_audit_table (TableName, LogID),
+    INDEX ix_audit_user (PerformedBy, LogID),
+    INDEX ix_audit_time (ActionTime)
 );
 
-DELIMITER $$
-CREATE TRIGGER trg_audit_employee_update
-AFTER UPDATE ON Employee
-FOR EACH ROW
-BEGIN
-    INSERT INTO AuditLog (TableName, ActionType, PerformedBy, Description)
-    VALUES ('Employee', 'UPDATE', NULL, CONCAT('Updated EmployeeID: ', OLD.EmployeeID));
-END$$
-DELIMITER ;
-
 DELIMITER $$
 CREATE TRIGGER trg_validate_attendance
 BEFORE INSERT ON Attendance
@@ -305,3 +410,8 @@ CREATE INDEX idx_employee_dept ON Employee(DepartmentID);
 CREATE INDEX idx_attendance_date ON Attendance(EmployeeID, Date);
 CREATE INDEX idx_payroll_paydate ON Payroll(PayDate);
 CREATE INDEX idx_review_date ON PerformanceReview(ReviewDate);
+-- Date-leading index for dashboard aggregation and date-range scans
+CREATE INDEX idx_attendance_day ON Attendance(Date);
+-- Payroll summary filters: per-employee history and "this month, this department"
+-- (Employee via idx_employee_dept, then a PayDate range on each employee)
+CREATE INDEX idx_payroll_emp_paydate ON Payroll(EmployeeID, PayDate);
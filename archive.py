@@ -0,0 +1,196 @@
+# Attendance retention: monthly RANGE partitions on Attendance.Date (MySQL) and gzip CSV
+# archives for the months that fall out of the retention window.
+# Driven by `python manage.py attendance-partitions` (see -h there); the API reads the
+# archives back through GET /attendances/archive.
+import csv
+import gzip
+import os
+from datetime import date, timedelta
+
+COLUMNS = ("AttendanceID", "EmployeeID", "Date", "timeIn", "timeOut")
+CATCH_ALL = "pmax"
+
+
+# --- MONTHS ---
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def months(first: date, last: date):
+    """First days of every month from `first` to `last`, both included."""
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+# --- PARTITIONS (MySQL) ---
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_defs(first: date, last: date) -> list:
+    return [
+        f"PARTITION {partition_name(m)} VALUES LESS THAN ('{add_months(m, 1).isoformat()}')"
+        for m in months(first, last)
+    ] + [f"PARTITION {CATCH_ALL} VALUES LESS THAN (MAXVALUE)"]
+
+
+def existing_partitions(conn) -> list:
+    """Monthly partitions of Attendance as first-of-month dates, oldest first ([] if not partitioned)."""
+    names = conn.exec_driver_sql(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Attendance' AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ).scalars().all()
+    return [date(int(n[1:5]), int(n[5:7]), 1) for n in names if n != CATCH_ALL]
+
+
+def convert(conn, months_ahead: int, today: date) -> list:
+    """Partition an existing, unpartitioned Attendance table in place.
+
+    MySQL requires the partitioning column in every unique key and allows no foreign keys
+    on partitioned tables, so the primary key becomes (AttendanceID, Date) and the
+    EmployeeID foreign key is dropped (the API checks EmployeeID before writing instead).
+    """
+    statements = [
+        f"ALTER TABLE Attendance DROP FOREIGN KEY {name}"
+        for name in conn.exec_driver_sql(
+            "SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS "
+            "WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'Attendance'"
+        ).scalars()
+    ]
+    statements.append("ALTER TABLE Attendance DROP PRIMARY KEY, ADD PRIMARY KEY (AttendanceID, Date)")
+    oldest = conn.exec_driver_sql("SELECT MIN(Date) FROM Attendance").scalar() or today
+    last = add_months(month_start(today), months_ahead)
+    statements.append(
+        "ALTER TABLE Attendance PARTITION BY RANGE COLUMNS(Date) (\n    "
+        + ",\n    ".join(partition_defs(month_start(oldest), last)) + "\n)"
+    )
+    for stmt in statements:
+        conn.exec_driver_sql(stmt)
+    return statements
+
+
+def ensure_partitions(conn, months_ahead: int, today: date) -> list:
+    """Split the catch-all partition so every month up to `months_ahead` from now has its own."""
+    existing = existing_partitions(conn)
+    if not existing:
+        raise SystemExit("Attendance is not partitioned; run with --convert first")
+    target = add_months(month_start(today), months_ahead)
+    new = list(months(add_months(existing[-1], 1), target))
+    if new:
+        conn.exec_driver_sql(
+            f"ALTER TABLE Attendance REORGANIZE PARTITION {CATCH_ALL} INTO ({', '.join(partition_defs(new[0], new[-1]))})"
+        )
+    return [partition_name(m) for m in new]
+
+
+# --- ARCHIVE ---
+def archive_path(archive_dir: str, month: date) -> str:
+    return os.path.join(archive_dir, f"Attendance-{month:%Y-%m}.csv.gz")
+
+
+def _clock(value) -> str:
+    # pymysql returns TIME as timedelta, SQLite as "HH:MM:SS[.ffffff]" text
+    if value is None:
+        return ""
+    if isinstance(value, timedelta):
+        seconds = int(value.total_seconds())
+        return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    return str(value)[:8]
+
+
+def _read_file(path: str):
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        yield from reader
+
+
+def _write_month(archive_dir: str, month: date, rows: list) -> None:
+    # Months archived before (e.g. late corrections to an old month) are merged, not replaced
+    path = archive_path(archive_dir, month)
+    if os.path.exists(path):
+        ids = {str(r[0]) for r in rows}
+        rows = [r for r in _read_file(path) if r[0] not in ids] + rows
+        rows.sort(key=lambda r: (r[2], int(r[1])))
+    tmp = path + ".tmp"
+    with gzip.open(tmp, "wt", newline="", encoding="utf-8", compresslevel=9) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    os.replace(tmp, path)
+
+
+def archive_before(conn, archive_dir: str, cutoff: date) -> dict:
+    """Write every Attendance row dated before `cutoff` (a first of month) to per-month
+    archive files, then drop those months from the table. Returns {month: rows}."""
+    os.makedirs(archive_dir, exist_ok=True)
+    result = conn.exec_driver_sql(
+        "SELECT AttendanceID, EmployeeID, Date, timeIn, timeOut FROM Attendance "
+        f"WHERE Date < '{cutoff.isoformat()}' ORDER BY Date, EmployeeID"
+    )
+    written, month, rows = {}, None, []
+    for r in result:
+        day = r.Date if isinstance(r.Date, date) else date.fromisoformat(str(r.Date))
+        if month is not None and month_start(day) != month:
+            _write_month(archive_dir, month, rows)
+            written[month] = len(rows)
+            rows = []
+        month = month_start(day)
+        rows.append([r.AttendanceID, r.EmployeeID, day.isoformat(), _clock(r.timeIn), _clock(r.timeOut)])
+    if rows:
+        _write_month(archive_dir, month, rows)
+        written[month] = len(rows)
+
+    # Không xóa gì nếu có dòng mới chen vào sau khi đọc: lần chạy sau sẽ gom nốt
+    remaining = conn.exec_driver_sql(f"SELECT COUNT(*) FROM Attendance WHERE Date < '{cutoff.isoformat()}'").scalar()
+    if remaining != sum(written.values()):
+        raise SystemExit(f"Attendance changed while archiving ({remaining} rows vs {sum(written.values())} written); "
+                         "archive files are complete, rerun to drop the months")
+    partitions = existing_partitions(conn) if conn.dialect.name == "mysql" else []
+    old = [m for m in partitions if m < cutoff]
+    if old:
+        # Xóa cả partition: tức thời, không sinh undo log như DELETE
+        conn.exec_driver_sql(f"ALTER TABLE Attendance DROP PARTITION {', '.join(partition_name(m) for m in old)}")
+    # Whatever is left (unpartitioned table, SQLite) goes row by row
+    conn.exec_driver_sql(f"DELETE FROM Attendance WHERE Date < '{cutoff.isoformat()}'")
+    conn.commit()
+    return written
+
+
+def archived_months(archive_dir: str) -> list:
+    if not os.path.isdir(archive_dir):
+        return []
+    return sorted(
+        date.fromisoformat(name[len("Attendance-"):-len(".csv.gz")] + "-01")
+        for name in os.listdir(archive_dir)
+        if name.startswith("Attendance-") and name.endswith(".csv.gz")
+    )
+
+
+def read_archive(archive_dir: str, start: date, end: date, employee_id=None):
+    """Archived rows dated start..end (inclusive) as dicts, oldest first."""
+    first, last = start.isoformat(), end.isoformat()
+    for month in months(start, end):
+        path = archive_path(archive_dir, month)
+        if not os.path.exists(path):
+            continue
+        for attendance_id, emp_id, day, time_in, time_out in _read_file(path):
+            if day < first or day > last:
+                continue
+            if employee_id is not None and int(emp_id) != employee_id:
+                continue
+            yield {
+                "AttendanceID": int(attendance_id),
+                "EmployeeID": int(emp_id),
+                "Date": day,
+                "timeIn": time_in or None,
+                "timeOut": time_out or None,
+            }
@@ -0,0 +1,313 @@
+"""Endpoint benchmark suite.
+
+Starts the app against a throwaway database, loads Project_script.sql's seed data
+multiplied by --scale, and drives the main routes at each concurrency level:
+
+    python benchmarks/endpoints.py --scale 20 --concurrency 1,8,32 --duration 5
+    python benchmarks/endpoints.py --database-url mysql+pymysql://root:pw@localhost/HRIS_bench --reset
+
+SQLite (a temp file) is the default; any other --database-url must point at an
+empty schema or be passed --reset, which drops and recreates every table in it.
+Queries per request come from the server's own /metrics, so they count exactly what
+the app executed. Prints one JSON document (also written to --output if given) so
+runs can be diffed over time.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+from sqlalchemy import func, inspect, select
+
+from login_storm import login, percentile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_SCRIPT = os.path.join(REPO_ROOT, "Project_script.sql")
+
+# (method, path) in run order; process-next writes, so it runs last and on its own
+READ_ROUTES = [
+    ("POST", "/token"),
+    ("GET", "/employees/"),
+    ("GET", "/attendances/"),
+    ("GET", "/payrolls/summary"),
+    ("GET", "/payrolls/report"),
+]
+PROCESS_NEXT = ("POST", "/payrolls/process-next")
+
+
+# --- DATA ---
+def seed_statements(dialect_name):
+    """INSERT statements from Project_script.sql, adapted to the target dialect."""
+    with open(SEED_SCRIPT, encoding="utf-8") as f:
+        script = f.read()
+    for raw in script.split(";"):
+        stmt = "\n".join(l for l in raw.splitlines() if not l.strip().startswith("--")).strip()
+        # INSERT ... SELECT backfills (the payroll rollup) are rebuilt through the app instead
+        if not stmt.upper().startswith("INSERT INTO") or "SELECT" in stmt.upper():
+            continue
+        if dialect_name == "sqlite":
+            stmt = stmt.replace("b'1'", "X'01'").replace("b'0'", "X'00'").replace("`", "")
+        yield stmt
+
+
+def load_data(app, scale):
+    """Create the schema and load the seed once plus (scale - 1) copies of every employee."""
+    tables = app.Base.metadata.tables
+    with app.engine.begin() as conn:
+        for stmt in seed_statements(app.engine.dialect.name):
+            conn.exec_driver_sql(stmt)
+
+        employees = conn.execute(tables["Employee"].select()).mappings().all()
+        children = {
+            name: conn.execute(tables[name].select()).mappings().all()
+            for name in ("Attendance", "Payroll", "PerformanceReview")
+        }
+        next_id = max(e["EmployeeID"] for e in employees) + 1
+        for copy in range(1, scale):
+            id_map = {}
+            new_employees = []
+            for e in employees:
+                id_map[e["EmployeeID"]] = next_id
+                local, _, domain = (e["Email"] or "bench@example.com").partition("@")
+                new_employees.append({**e, "EmployeeID": next_id, "Email": f"{local}+{copy}@{domain}"})
+                next_id += 1
+            conn.execute(tables["Employee"].insert(), new_employees)
+            for name, rows in children.items():
+                pk = tables[name].primary_key.columns.values()[0].name
+                copies = [
+                    {k: v for k, v in {**r, "EmployeeID": id_map[r["EmployeeID"]]}.items() if k != pk}
+                    for r in rows
+                ]
+                if copies:
+                    conn.execute(tables[name].insert(), copies)
+
+    with app.SessionLocal() as db:
+        app.rebuild_payroll_rollup(db)
+        db.commit()
+    with app.engine.connect() as conn:
+        return {
+            name: conn.execute(select(func.count()).select_from(tables[name])).scalar()
+            for name in ("Department", "Employee", "Attendance", "Payroll", "PerformanceReview")
+        }
+
+
+def prepare_database(database_url, scale, reset):
+    # settings.py reads the URL at import time, so main must be imported after this
+    os.environ["HRIS_DATABASE_URL"] = database_url
+    if database_url.startswith("sqlite:"):
+        os.environ["HRIS_ASYNC_DATABASE_URL"] = database_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    sys.path.insert(0, REPO_ROOT)
+    with contextlib.redirect_stdout(sys.stderr):  # main prints on import; keep stdout pure JSON
+        import main as app
+
+    if reset:
+        app.Base.metadata.drop_all(app.engine)
+    elif not database_url.startswith("sqlite:"):
+        existing = inspect(app.engine).get_table_names()
+        if existing:
+            sys.exit(f"{database_url} already has tables {existing}; pass --reset to drop them")
+    app.Base.metadata.create_all(app.engine)
+    counts = load_data(app, scale)
+    dialect = app.engine.dialect.name
+    app.engine.dispose()
+    return dialect, counts
+
+
+# --- SERVER ---
+def start_server(port, env):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            sys.exit(f"server exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/internal/pool", timeout=2):
+                return proc, url
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.25)
+    proc.terminate()
+    sys.exit("server did not start within 60s")
+
+
+def scrape_queries(url):
+    """{(method, route): (sum of SQL statements, request count)} from /metrics."""
+    with urllib.request.urlopen(f"{url}/metrics", timeout=30) as resp:
+        text = resp.read().decode()
+    result = {}
+    pattern = re.compile(r'^hris_http_request_sql_queries_(sum|count)\{method="([^"]+)",route="([^"]+)"\} (\S+)$')
+    for line in text.splitlines():
+        m = pattern.match(line)
+        if m:
+            kind, method, route, value = m.groups()
+            entry = result.setdefault((method, route), [0.0, 0.0])
+            entry[0 if kind == "sum" else 1] = float(value)
+    return result
+
+
+# --- LOAD ---
+def make_request(url, method, path, token, username, password):
+    if path == "/token":
+        return lambda: login(url, username, password)
+    req = urllib.request.Request(f"{url}{path}", method=method,
+                                 data=b"" if method == "POST" else None,
+                                 headers={"Authorization": f"Bearer {token}"})
+
+    def call():
+        with urllib.request.urlopen(req, timeout=120) as resp:
+            body = resp.read()
+        if resp.status == 202:
+            # Background job: time it through to completion, as the user experiences it
+            wait_job(url, json.loads(body)["jobId"], token)
+    return call
+
+
+def wait_job(url, job_id, token, timeout=600):
+    req = urllib.request.Request(f"{url}/jobs/{job_id}", headers={"Authorization": f"Bearer {token}"})
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            job = json.loads(resp.read())
+        if job["status"] == "succeeded":
+            return
+        if job["status"] == "failed":
+            raise OSError(f"job {job_id} failed: {job['error']}")
+        time.sleep(0.05)
+    raise OSError(f"job {job_id} still {job['status']} after {timeout}s")
+
+
+def drive(fn, concurrency, duration=None, total=None):
+    """Run fn from `concurrency` threads for `duration` seconds (or `total` calls)."""
+    lock = threading.Lock()
+    latencies, errors = [], [0]
+    stop = threading.Event()
+    remaining = [total]
+
+    def worker():
+        while not stop.is_set():
+            if total is not None:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+            start = time.perf_counter()
+            try:
+                fn()
+            except (urllib.error.URLError, OSError):
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    if duration is not None:
+        time.sleep(duration)
+        stop.set()
+    for t in threads:
+        t.join()
+    return latencies, errors[0], time.perf_counter() - start
+
+
+def measure(url, method, path, fn, concurrency, **limits):
+    before = scrape_queries(url).get((method, path), (0.0, 0.0))
+    latencies, errors, elapsed = drive(fn, concurrency, **limits)
+    # The server records a request after the client already has the response; wait for it
+    deadline = time.monotonic() + 5
+    while True:
+        after = scrape_queries(url).get((method, path), (0.0, 0.0))
+        if after[1] - before[1] >= len(latencies) or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+    requests = after[1] - before[1]
+    ms = lambda pct: round(percentile(latencies, pct) * 1000, 2) if latencies else None
+    return {
+        "route": f"{method} {path}",
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0,
+        "p50_ms": ms(50),
+        "p95_ms": ms(95),
+        "p99_ms": ms(99),
+        "queries_per_request": round((after[0] - before[0]) / requests, 2) if requests else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="default: a temporary SQLite file")
+    parser.add_argument("--reset", action="store_true", help="drop all tables in --database-url first")
+    parser.add_argument("--scale", type=int, default=10, help="copies of the seed employees and their rows")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated client counts")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per route and concurrency level")
+    parser.add_argument("--process-next-runs", type=int, default=3, help="sequential payroll runs to time")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--no-cache", action="store_true", help="start the server with the response cache off")
+    parser.add_argument("--username", default="hung_admin")
+    parser.add_argument("--password", default="pass123")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    workdir = None
+    database_url = args.database_url
+    if database_url is None:
+        workdir = tempfile.mkdtemp(prefix="hris-bench-")
+        database_url = "sqlite:///" + os.path.join(workdir, "bench.db")
+    dialect, counts = prepare_database(database_url, args.scale, args.reset)
+
+    env = dict(os.environ)
+    if args.no_cache:
+        env["HRIS_RESPONSE_CACHE_BACKEND"] = "off"
+    proc, url = start_server(args.port, env)
+    try:
+        token = login(url, args.username, args.password)
+        results = []
+        for method, path in READ_ROUTES:
+            fn = make_request(url, method, path, token, args.username, args.password)
+            fn()  # warm-up: first login rehashes the seed password, first report renders the PDF
+            for level in levels:
+                results.append(measure(url, method, path, fn, level, duration=args.duration))
+        if args.process_next_runs:
+            fn = make_request(url, *PROCESS_NEXT, token, args.username, args.password)
+            results.append(measure(url, *PROCESS_NEXT, fn, 1, total=args.process_next_runs))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "dialect": dialect,
+        "scale": args.scale,
+        "rows": counts,
+        "response_cache": "off" if args.no_cache else env.get("HRIS_RESPONSE_CACHE_BACKEND", "memory"),
+        "duration_s": args.duration,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
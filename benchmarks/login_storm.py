@@ -0,0 +1,114 @@
+"""Login storm benchmark.
+
+Measures /token throughput and what a burst of bcrypt logins does to the latency
+of an unrelated endpoint. Runs against an already started server:
+
+    python -m uvicorn main:app --workers 1
+    python benchmarks/login_storm.py --url http://127.0.0.1:8000 --duration 10
+
+Prints one JSON document with a baseline phase (probe only) and a storm phase
+(probe + concurrent logins) so the two p99 values can be compared.
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies, errors, elapsed):
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+    }
+
+
+def login(url, username, password):
+    body = urllib.parse.urlencode({"username": username, "password": password}).encode()
+    req = urllib.request.Request(f"{url}/token", data=body, method="POST")
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return json.loads(resp.read())["access_token"]
+
+
+def run_loop(stop, fn, latencies, errors, lock):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            fn()
+        except (urllib.error.URLError, OSError):
+            with lock:
+                errors[0] += 1
+            continue
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+
+def run_phase(duration, probe, storm=None, storm_concurrency=0):
+    stop = threading.Event()
+    lock = threading.Lock()
+    probe_lat, probe_err = [], [0]
+    storm_lat, storm_err = [], [0]
+    threads = [threading.Thread(target=run_loop, args=(stop, probe, probe_lat, probe_err, lock))]
+    threads += [
+        threading.Thread(target=run_loop, args=(stop, storm, storm_lat, storm_err, lock))
+        for _ in range(storm_concurrency)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    result = {"probe": summarize(probe_lat, probe_err[0], elapsed)}
+    if storm is not None:
+        result["login"] = summarize(storm_lat, storm_err[0], elapsed)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", default="hung_admin")
+    parser.add_argument("--password", default="pass123")
+    parser.add_argument("--probe-path", default="/departments/")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent login clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    args = parser.parse_args()
+
+    token = login(args.url, args.username, args.password)
+    probe_req = urllib.request.Request(f"{args.url}{args.probe_path}",
+                                       headers={"Authorization": f"Bearer {token}"})
+
+    def probe():
+        with urllib.request.urlopen(probe_req, timeout=30) as resp:
+            resp.read()
+
+    report = {
+        "url": args.url,
+        "probe_path": args.probe_path,
+        "login_concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "baseline": run_phase(args.duration, probe),
+        "storm": run_phase(args.duration, probe,
+                           lambda: login(args.url, args.username, args.password), args.concurrency),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Startup benchmark.
+
+Tracks how long a worker takes to become useful after a deploy or restart:
+
+  * import time of main (median of --runs fresh interpreters) and the heaviest
+    modules main pulls in, from python -X importtime;
+  * time to first response: spawn uvicorn, poll until it answers, then time the first
+    and second authenticated requests. Runs with the startup pool warm-up on (the
+    configured HRIS_DB_POOL_WARM_CONNECTIONS) and off (0), interleaved.
+
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --database-url mysql+pymysql://root:pw@localhost/HRIS_bench --reset
+
+Uses the same throwaway database setup as endpoints.py and prints one JSON document
+(also written to --output if given) so runs can be diffed over time.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+from endpoints import REPO_ROOT, prepare_database
+
+# Only report endpoints need these; they must not be loaded by `import main`
+LAZY_MODULES = ("reportlab", "dateutil")
+IMPORT_PROBE = f"""
+import json, sys, time
+t = time.perf_counter()
+import main
+elapsed = time.perf_counter() - t
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))
+"""
+# Different query strings, so the second request is not a response cache hit
+FIRST_REQUEST = "/employees/?limit=20"
+SECOND_REQUEST = "/employees/?limit=20&skip=20"
+
+
+# --- IMPORT TIME ---
+def parse_importtime(stderr, top):
+    """Modules imported directly by main, heaviest (cumulative) first."""
+    children = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        # Children are printed before their parent; other top-level trees (site, ...) are dropped
+        if depth == 0:
+            if name == "main":
+                break
+            children = []
+        elif depth == 1:
+            children.append((name, int(self_us.split(":")[-1]), int(cumulative_us)))
+    children.sort(key=lambda c: -c[2])
+    return [{"module": name, "cumulative_ms": round(cum / 1000, 1), "self_ms": round(own / 1000, 1)}
+            for name, own, cum in children[:top]]
+
+
+def measure_import(env, runs, top):
+    seconds, loaded, top_imports = [], [], []
+    for i in range(runs):
+        # -X importtime on the last run only: it adds its own overhead to the timings
+        flags = ["-X", "importtime"] if i == runs - 1 else []
+        proc = subprocess.run([sys.executable, *flags, "-c", IMPORT_PROBE], cwd=REPO_ROOT, env=env,
+                              capture_output=True, text=True, check=True)
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if flags:
+            top_imports = parse_importtime(proc.stderr, top)
+        else:
+            seconds.append(result["seconds"])
+        loaded = result["loaded"]
+    return {
+        "runs": len(seconds),
+        "median_ms": round(statistics.median(seconds) * 1000, 1) if seconds else None,
+        "min_ms": round(min(seconds) * 1000, 1) if seconds else None,
+        "lazy_modules_loaded": loaded,
+        "top_imports": top_imports,
+    }
+
+
+# --- FIRST RESPONSE ---
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def timed_get(url, token):
+    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        resp.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_first_response(env, token):
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            if proc.poll() is not None:
+                sys.exit(f"server exited with code {proc.returncode}")
+            if time.monotonic() > deadline:
+                sys.exit("server did not start within 60s")
+            try:
+                # Unauthenticated and DB-free: answers as soon as the worker accepts requests
+                with urllib.request.urlopen(f"{url}/internal/pool", timeout=2):
+                    break
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.005)
+        ready = (time.perf_counter() - start) * 1000
+        first = timed_get(url + FIRST_REQUEST, token)
+        second = timed_get(url + SECOND_REQUEST, token)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {"ready_ms": ready, "first_request_ms": first, "second_request_ms": second,
+            "first_useful_response_ms": ready + first}
+
+
+def summarize_runs(samples):
+    return {key: round(statistics.median(s[key] for s in samples), 1) for key in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="default: a temporary SQLite file")
+    parser.add_argument("--reset", action="store_true", help="drop all tables in --database-url first")
+    parser.add_argument("--scale", type=int, default=1, help="copies of the seed employees and their rows")
+    parser.add_argument("--runs", type=int, default=5, help="interpreter starts per measurement")
+    parser.add_argument("--top", type=int, default=10, help="heaviest imports to list")
+    parser.add_argument("--username", default="hung_admin")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="hris-bench-"), "bench.db")
+    dialect, counts = prepare_database(database_url, args.scale, args.reset)
+    with contextlib.redirect_stdout(sys.stderr):
+        import main as app
+    token = app.create_access_token({"sub": args.username}, timedelta(minutes=60))
+
+    env = dict(os.environ)
+    cold_env = dict(env, HRIS_DB_POOL_WARM_CONNECTIONS="0")
+    imports = measure_import(env, args.runs + 1, args.top)
+    warm, cold = [], []
+    for _ in range(args.runs):
+        warm.append(measure_first_response(env, token))
+        cold.append(measure_first_response(cold_env, token))
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "dialect": dialect,
+        "scale": args.scale,
+        "rows": counts,
+        "import": imports,
+        "first_response": {
+            "warm_connections": app.DB_POOL_WARM_CONNECTIONS,
+            "warm": summarize_runs(warm),
+            "cold": summarize_runs(cold),
+        },
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
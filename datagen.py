@@ -0,0 +1,236 @@
+# Synthetic HRIS data at scale: departments, employees, weekday attendance,
+# monthly payroll and quarterly reviews, consistent with each other and with the schema.
+# Driven by `python manage.py generate-data` (see -h there); the same --seed gives the same data.
+import calendar
+import csv
+import os
+import random
+import time
+from datetime import date, timedelta
+
+DEPARTMENT_NAMES = [
+    "Engineering", "Product Management", "Quality Assurance", "Human Resources", "Sales",
+    "Marketing", "Customer Support", "IT Support", "Research and Development", "Finance",
+    "Legal", "Operations", "Procurement", "Data Analytics", "Security", "Design",
+]
+FIRST_NAMES = [
+    "Anh", "Binh", "Chi", "Dung", "Duc", "Giang", "Ha", "Hai", "Hanh", "Hoa", "Hung", "Huong",
+    "Khanh", "Khoa", "Lan", "Linh", "Long", "Mai", "Minh", "My", "Nam", "Ngoc", "Nhung", "Phong",
+    "Phuong", "Quang", "Quynh", "Son", "Tam", "Thao", "Thanh", "Trang", "Trung", "Tuan", "Viet", "Vy",
+]
+LAST_NAMES = [
+    "Nguyen", "Tran", "Le", "Pham", "Hoang", "Phan", "Vu", "Vo", "Dang", "Bui", "Do", "Ho",
+    "Ngo", "Duong", "Ly", "Trinh", "Dinh", "Lam", "Mai", "Truong",
+]
+REVIEW_COMMENTS = {
+    "low": ["Needs improvement on deadlines.", "Below expectations this quarter.", "Requires closer support."],
+    "mid": ["Meets expectations.", "Reliable and consistent.", "Solid quarter, room to grow."],
+    "high": ["Excellent performance.", "Exceeded targets this quarter.", "Outstanding problem-solving."],
+}
+
+# Table -> columns in write order; parents before children (foreign keys)
+TABLES = {
+    "Department": ("DepartmentID", "DeptName"),
+    "Employee": ("EmployeeID", "FirstName", "LastName", "DOB", "Phone", "Email", "Gender", "DepartmentID"),
+    "Attendance": ("EmployeeID", "Date", "timeIn", "timeOut"),
+    "Payroll": ("EmployeeID", "Salary", "Bonus", "Deduction", "PayDate"),
+    "PerformanceReview": ("EmployeeID", "ReviewDate", "Score", "Comments", "WorkingHours"),
+}
+
+# "HH:MM:SS" for every second of the day, so the attendance loop never formats times
+CLOCK = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)]
+WORK_START = 9 * 3600
+
+
+# --- SINKS ---
+class InsertSink:
+    """Buffered executemany on one connection; pymysql turns it into multi-row INSERTs."""
+
+    def __init__(self, conn, table, columns, chunk_size):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.rows = []
+        self.count = 0
+        mark = "?" if conn.dialect.paramstyle == "qmark" else "%s"
+        self.sql = "INSERT INTO {} ({}) VALUES ({})".format(table, ", ".join(columns), ", ".join([mark] * len(columns)))
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.conn.exec_driver_sql(self.sql, self.rows)
+            self.conn.commit()
+            self.count += len(self.rows)
+            self.rows = []
+
+
+class CsvSink:
+    r"""One CSV file per table; NULL as \N and BINARY as hex, as LOAD DATA expects."""
+
+    def __init__(self, out_dir, table, columns):
+        self.table = table
+        self.columns = columns
+        self.path = os.path.join(out_dir, f"{table}.csv")
+        self.file = open(self.path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file, lineterminator="\n")
+        self.count = 0
+
+    def add(self, row):
+        self.writer.writerow([
+            "\\N" if v is None else v.hex() if isinstance(v, bytes) else v
+            for v in row
+        ])
+        self.count += 1
+
+    def flush(self):
+        self.file.close()
+
+    def load_statement(self):
+        columns = ", ".join("@Gender" if c == "Gender" else c for c in self.columns)
+        sql = (f"LOAD DATA LOCAL INFILE '{self.path}' INTO TABLE {self.table} "
+               f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n' ({columns})")
+        if "Gender" in self.columns:
+            sql += " SET Gender = UNHEX(@Gender)"
+        return sql
+
+
+# --- GENERATOR ---
+def weekdays(start: date, end: date):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+
+def month_ends(start: date, end: date):
+    year, month = start.year, start.month
+    while True:
+        last = date(year, month, calendar.monthrange(year, month)[1])
+        if last > end:
+            return
+        yield last
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def quarter_end(day: date) -> date:
+    month = (day.month - 1) // 3 * 3 + 3
+    return date(day.year, month, calendar.monthrange(day.year, month)[1])
+
+
+def existing_state(conn):
+    """Next free IDs and department names already present, so generated rows append cleanly."""
+    next_employee = (conn.exec_driver_sql("SELECT MAX(EmployeeID) FROM Employee").scalar() or 0) + 1
+    departments = {name: dept_id for dept_id, name in conn.exec_driver_sql("SELECT DepartmentID, DeptName FROM Department")}
+    next_department = max(departments.values(), default=0) + 1
+    return next_employee, next_department, departments
+
+
+def generate(conn, sinks, departments: int, employees: int, start: date, end: date, seed: int,
+             absence_rate: float, late_rate: float) -> dict:
+    rng = random.Random(seed)
+    next_employee, next_department, known = existing_state(conn)
+
+    # Departments: reuse names that already exist, add the rest (and "Division N" beyond the list)
+    names = DEPARTMENT_NAMES[:departments] + [f"Division {i}" for i in range(len(DEPARTMENT_NAMES) + 1, departments + 1)]
+    dept_ids = []
+    for name in names:
+        if name not in known:
+            known[name] = next_department
+            sinks["Department"].add((next_department, name))
+            next_department += 1
+        dept_ids.append(known[name])
+    sinks["Department"].flush()
+    # A few big departments and a long tail, like a real org chart
+    dept_weights = [1 / (i + 1) ** 0.8 for i in range(len(dept_ids))]
+    dept_base_salary = {d: rng.randrange(15, 30) * 1_000_000 for d in dept_ids}
+
+    people = []
+    for emp_id in range(next_employee, next_employee + employees):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        dept = rng.choices(dept_ids, dept_weights)[0]
+        dob = date(1965, 1, 1) + timedelta(days=rng.randrange(14600))
+        # 80% were already employed when the range starts, the rest join during it
+        if rng.random() < 0.8:
+            hired = start - timedelta(days=rng.randrange(1, 5 * 365))
+        else:
+            hired = start + timedelta(days=rng.randrange(max((end - start).days, 1)))
+        salary = round(dept_base_salary[dept] * rng.lognormvariate(0, 0.25), -5)
+        sinks["Employee"].add((
+            emp_id, first, last, dob.isoformat(), "09" + "".join(rng.choices("0123456789", k=8)),
+            f"{first}.{last}.{emp_id}@hris.example".lower(), b"\x01" if rng.random() < 0.5 else b"\x00", dept,
+        ))
+        people.append((emp_id, hired, salary))
+    sinks["Employee"].flush()
+
+    days = [(d, d.isoformat(), quarter_end(d)) for d in weekdays(start, end)]
+    pay_dates = list(month_ends(start, end))
+    attendance, payroll, reviews = sinks["Attendance"], sinks["Payroll"], sinks["PerformanceReview"]
+    forgot_rate = 0.01
+    for emp_id, hired, salary in people:
+        worked = {}  # quarter end -> seconds, feeds WorkingHours
+        for day, day_iso, quarter in days:
+            if day < hired:
+                continue
+            r = rng.random()
+            if r < absence_rate:
+                continue  # vắng mặt: không có bản ghi
+            if rng.random() < late_rate:
+                arrive = WORK_START + 60 + int(rng.expovariate(1 / 900))
+            else:
+                arrive = WORK_START - int(rng.uniform(0, 2100))
+            arrive = min(arrive, 13 * 3600)
+            if r < absence_rate + forgot_rate:
+                attendance.add((emp_id, day_iso, CLOCK[arrive], None))  # quên chấm công ra
+                continue
+            leave = min(arrive + 9 * 3600 + int(rng.gauss(0, 1200)), 86399)
+            leave = max(leave, arrive + 4 * 3600)
+            attendance.add((emp_id, day_iso, CLOCK[arrive], CLOCK[leave]))
+            worked[quarter] = worked.get(quarter, 0) + leave - arrive - 3600  # minus lunch
+
+        for pay_date in pay_dates:
+            if pay_date < hired:
+                continue
+            raise_years = pay_date.year - start.year
+            bonus = rng.choice((500_000, 1_000_000, 1_500_000, 2_000_000)) if rng.random() < 0.3 else 0
+            deduction = rng.choice((200_000, 500_000, 1_000_000)) if rng.random() < 0.15 else 0
+            payroll.add((emp_id, round(salary * 1.05 ** raise_years, -5), bonus, deduction, pay_date.isoformat()))
+
+        for quarter, seconds in sorted(worked.items()):
+            score = min(10, max(1, round(rng.gauss(7, 1.5))))
+            band = "low" if score <= 4 else "mid" if score <= 7 else "high"
+            reviews.add((emp_id, quarter.isoformat(), score, rng.choice(REVIEW_COMMENTS[band]), seconds // 3600))
+
+    for table in ("Attendance", "Payroll", "PerformanceReview"):
+        sinks[table].flush()
+    return {table: sink.count for table, sink in sinks.items()}
+
+
+def run(engine, method: str, out_dir: str, chunk_size: int, **options) -> dict:
+    """Generate into `engine` (method "insert" or "load-data") or only write CSVs (method "csv")."""
+    started = time.perf_counter()
+    mysql = engine.dialect.name == "mysql"
+    with engine.connect() as conn:
+        if mysql:
+            # Dữ liệu sinh ra đã nhất quán, bỏ kiểm tra FK/unique cho phiên nạp
+            conn.exec_driver_sql("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+        if method == "insert":
+            sinks = {t: InsertSink(conn, t, cols, chunk_size) for t, cols in TABLES.items()}
+            counts = generate(conn, sinks, **options)
+        else:
+            os.makedirs(out_dir, exist_ok=True)
+            sinks = {t: CsvSink(os.path.abspath(out_dir), t, cols) for t, cols in TABLES.items()}
+            counts = generate(conn, sinks, **options)
+            if method == "load-data":
+                if not mysql:
+                    raise SystemExit("--method load-data needs a MySQL database (local_infile enabled)")
+                for sink in sinks.values():
+                    conn.exec_driver_sql(sink.load_statement())
+                conn.commit()
+        if mysql:
+            conn.exec_driver_sql("SET SESSION foreign_key_checks = 1, unique_checks = 1")
+    counts["seconds"] = round(time.perf_counter() - started, 2)
+    return counts
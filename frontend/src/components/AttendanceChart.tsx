@@ -21,16 +21,23 @@ type AttendanceRecord = {
   DepartmentName?: string | null;
 };
 
-type Employee = {
-  EmployeeID: number;
-  FirstName: string;
-  LastName: string;
-  DepartmentID?: number;
+type DashboardDay = {
+  date: string;
+  present: number;
+  late: number;
+  absent: number;
+  avgHours: number | null;
+};
+
+type AttendanceDashboard = {
+  onTimeCutoff: string;
+  headcount: number;
+  days: DashboardDay[];
 };
 
 const AttendanceChart = () => {
   const [attendanceRecords, setAttendanceRecords] = useState<AttendanceRecord[]>([]);
-  const [employees, setEmployees] = useState<Employee[]>([]);
+  const [dashboard, setDashboard] = useState<AttendanceDashboard | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -40,13 +47,13 @@ const AttendanceChart = () => {
     setLoading(true);
     setError(null);
 
-    // Fetch employees and attendance in parallel
+    // Aggregated counts come from the server; raw records are only needed for the recent list
     Promise.all([
-      axios.get<Employee[]>(`${API_URL}/employees/`, { headers: { Authorization: token ? `Bearer ${token}` : '' } }),
+      axios.get<AttendanceDashboard>(`${API_URL}/attendances/dashboard`, { headers: { Authorization: token ? `Bearer ${token}` : '' } }),
       axios.get<AttendanceRecord[]>(`${API_URL}/attendances/`, { headers: { Authorization: token ? `Bearer ${token}` : '' } }),
     ])
-      .then(([empRes, attRes]) => {
-        setEmployees(empRes.data);
+      .then(([dashRes, attRes]) => {
+        setDashboard(dashRes.data);
         setAttendanceRecords(attRes.data);
       })
       .catch(err => {
@@ -56,78 +63,29 @@ const AttendanceChart = () => {
       .finally(() => setLoading(false));
   }, [token]);
 
-  // Utility to parse HH:mm:ss into minutes
-  const timeToMinutes = (timeStr?: string | null) => {
-    if (!timeStr) return null;
-    const [h, m, s] = timeStr.split(':').map(Number);
-    return h * 60 + m + s / 60;
-  };
+  const onTimeCutoff = dashboard?.onTimeCutoff ?? '09:00:00';
 
-  // Group attendance by date for aggregation
-  const attendanceByDate = attendanceRecords.reduce((acc, record) => {
-    acc[record.Date] = acc[record.Date] || [];
-    acc[record.Date].push(record);
-    return acc;
-  }, {} as Record<string, AttendanceRecord[]>);
-
-  // Get all unique dates sorted ascending
-  const allDates = Object.keys(attendanceByDate).sort();
-
-  // Calculate attendance status per employee per date
-  // Status: "On Time" (timeIn <= 09:00), "Late" (timeIn > 09:00), "Absent" (no attendance record)
-  const getStatusForEmployee = (employeeID: number, date: string) => {
-    const records = attendanceByDate[date] || [];
-    const rec = records.find(r => r.EmployeeID === employeeID);
-    if (!rec || !rec.timeIn) return 'Absent';
-    return rec.timeIn <= '09:00:00' ? 'On Time' : 'Late';
+  // Status: "On Time" (timeIn <= cutoff), "Late" (timeIn > cutoff), "Absent" (no timeIn)
+  const getStatusForRecord = (record: AttendanceRecord) => {
+    if (!record.timeIn) return 'Absent';
+    return record.timeIn <= onTimeCutoff ? 'On Time' : 'Late';
   };
 
-  // Calculate weeklyData for charts: counts of present/late/absent per day (Mon-Fri)
+  // Chart data: counts of present/late/absent per day (Mon-Fri)
   const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
 
-  const weeklyData = allDates.map(date => {
-    const dayName = dayNames[new Date(date).getDay()];
-    let present = 0;
-    let late = 0;
-    let absent = 0;
-    employees.forEach(emp => {
-      const status = getStatusForEmployee(emp.EmployeeID, date);
-      if (status === 'On Time') present++;
-      else if (status === 'Late') late++;
-      else absent++;
-    });
-    return { day: dayName, present, late, absent, date };
-  });
-
-  // Today's date (most recent in data)
-  const todayDate = allDates.length ? allDates[allDates.length - 1] : null;
+  const weeklyData = (dashboard?.days ?? []).map(d => ({
+    ...d,
+    day: dayNames[new Date(d.date).getDay()],
+  }));
 
-  // Today's attendance summary
-  const todaySummary = todayDate
-    ? {
-        present: weeklyData.find(d => d.date === todayDate)?.present ?? 0,
-        late: weeklyData.find(d => d.date === todayDate)?.late ?? 0,
-        absent: weeklyData.find(d => d.date === todayDate)?.absent ?? 0,
-      }
+  // Today's attendance summary (most recent day in data)
+  const today = weeklyData.length ? weeklyData[weeklyData.length - 1] : null;
+  const todaySummary = today
+    ? { present: today.present, late: today.late, absent: today.absent }
     : { present: 0, late: 0, absent: 0 };
 
-  // Calculate average hours per employee today (timeOut - timeIn)
-  let totalMinutes = 0;
-  let countedEmployees = 0;
-  if (todayDate) {
-    employees.forEach(emp => {
-      const rec = attendanceByDate[todayDate]?.find(r => r.EmployeeID === emp.EmployeeID);
-      if (rec?.timeIn && rec.timeOut) {
-        const inM = timeToMinutes(rec.timeIn);
-        const outM = timeToMinutes(rec.timeOut);
-        if (inM !== null && outM !== null && outM > inM) {
-          totalMinutes += outM - inM;
-          countedEmployees++;
-        }
-      }
-    });
-  }
-  const avgHours = countedEmployees > 0 ? (totalMinutes / countedEmployees / 60).toFixed(1) : '--';
+  const avgHours = today?.avgHours != null ? today.avgHours.toFixed(1) : '--';
 
   // Recent attendance records (last 10)
   const recentRecords = [...attendanceRecords]
@@ -264,7 +222,7 @@ const AttendanceChart = () => {
         <CardContent>
           <div className="space-y-4">
             {recentRecords.map(record => {
-              const status = getStatusForEmployee(record.EmployeeID, record.Date);
+              const status = getStatusForRecord(record);
               return (
                 <div
                   key={record.AttendanceID}
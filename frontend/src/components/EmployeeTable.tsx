@@ -85,16 +85,41 @@ const EmployeeTable = () => {
       .finally(() => setLoading(false));
   }, []);
 
-  // Filter employees by search term and department filter
-  const filteredEmployees = employees.filter((employee) => {
-    const fullName = `${employee.FirstName} ${employee.LastName}`.toLowerCase();
-    const matchesSearch =
-      fullName.includes(searchTerm.toLowerCase()) ||
-      (employee.Email && employee.Email.toLowerCase().includes(searchTerm.toLowerCase()));
-    const matchesDepartment =
-      departmentFilter === 'all' || employee.DepartmentID?.toString() === departmentFilter;
-    return matchesSearch && matchesDepartment;
-  });
+  // Search on the server (the list above is only the first page); debounced while typing
+  const [searchResults, setSearchResults] = useState<Employee[] | null>(null);
+
+  useEffect(() => {
+    const term = searchTerm.trim();
+    if (!term) {
+      setSearchResults(null);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const params: Record<string, string | number> = { q: term, limit: 100 };
+        if (departmentFilter !== 'all') params.department_id = Number(departmentFilter);
+        const response = await axios.get<Employee[]>(`${API_URL}/employees/search`, {
+          params,
+          headers: {
+            Authorization: token ? `Bearer ${token}` : '',
+          },
+        });
+        if (!cancelled) setSearchResults(response.data);
+      } catch (error) {
+        console.error('Failed to search employees', error);
+        if (!cancelled) setSearchResults([]);
+      }
+    }, 250);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchTerm, departmentFilter, token]);
+
+  const filteredEmployees = searchResults ?? employees.filter(
+    (employee) => departmentFilter === 'all' || employee.DepartmentID?.toString() === departmentFilter
+  );
 
   const getDepartmentName = (deptId?: number) => {
     if (!deptId) return 'No Department';
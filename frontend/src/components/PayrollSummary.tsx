@@ -48,6 +48,14 @@ interface PayrollRecord {
   payDate: string;
 }
 
+interface JobStatus {
+  jobId: string;
+  status: "queued" | "running" | "succeeded" | "failed";
+  progress: number;
+  message: string | null;
+  error: string | null;
+}
+
 interface DepartmentSummary {
   department: string;
   totalPay: number;
@@ -61,6 +69,7 @@ const PayrollSummary = () => {
   const [error, setError] = useState<string | null>(null);
   const [processingPayroll, setProcessingPayroll] = useState(false);
   const [generatingReport, setGeneratingReport] = useState(false);
+  const [reportProgress, setReportProgress] = useState(0);
 
   const token = localStorage.getItem("access_token");
 
@@ -114,11 +123,38 @@ const PayrollSummary = () => {
     return colors[dept] || "bg-gray-100 text-gray-700";
   };
 
+  const authHeaders = { Authorization: token ? `Bearer ${token}` : "" };
+
+  // Submit a background job; if one of that type is already running (409), follow it instead
+  const submitJob = async (path: string): Promise<string> => {
+    try {
+      const res = await axios.post<JobStatus>(`${API_URL}${path}`, {}, { headers: authHeaders });
+      return res.data.jobId;
+    } catch (err: any) {
+      const running = err.response?.status === 409 && err.response.data?.detail?.jobId;
+      if (running) return running;
+      throw err;
+    }
+  };
+
+  const waitForJob = async (jobId: string, onProgress?: (percent: number) => void) => {
+    for (;;) {
+      const res = await axios.get<JobStatus>(`${API_URL}/jobs/${jobId}`, { headers: authHeaders });
+      if (res.data.status === "succeeded") return;
+      if (res.data.status === "failed") throw new Error(res.data.error || "Job failed");
+      onProgress?.(res.data.progress);
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+    }
+  };
+
   const handleGenerateReport = async () => {
     setGeneratingReport(true);
+    setReportProgress(0);
     try {
-      const res = await axios.get(`${API_URL}/payrolls/report`, {
-        headers: { Authorization: token ? `Bearer ${token}` : "" },
+      const jobId = await submitJob("/payrolls/report");
+      await waitForJob(jobId, setReportProgress);
+      const res = await axios.get(`${API_URL}/jobs/${jobId}/result`, {
+        headers: authHeaders,
         responseType: "blob",
       });
       const blob = new Blob([res.data], { type: "application/pdf" });
@@ -133,11 +169,7 @@ const PayrollSummary = () => {
   const handleProcessNextPayroll = async () => {
     setProcessingPayroll(true);
     try {
-      await axios.post(
-        `${API_URL}/payrolls/process-next`,
-        {},
-        { headers: { Authorization: token ? `Bearer ${token}` : "" } }
-      );
+      await waitForJob(await submitJob("/payrolls/process-next"));
       alert("Next payroll processed successfully!");
       await Promise.all([fetchPayrollData(), fetchDepartmentSummary()]);
     } catch {
@@ -245,7 +277,7 @@ const PayrollSummary = () => {
               disabled={generatingReport}
             >
               <Download className="w-4 h-4 mr-2" />
-              {generatingReport ? "Generating..." : "Generate Payroll Report"}
+              {generatingReport ? `Generating... ${reportProgress}%` : "Generate Payroll Report"}
             </Button>
 
             <div className="pt-4 border-t">
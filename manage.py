@@ -0,0 +1,197 @@
+# Maintenance commands for the HRIS backend.
+# Usage: python manage.py <command> [options]   (python manage.py -h lists them)
+import argparse
+import json
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+
+import archive
+import datagen
+import snapshots
+from main import (
+    Base, CACHED_TABLES, DATABASE_URL, SessionLocal, engine, bump_table_versions, rebuild_payroll_rollup,
+    count_worked_hours, sync_review_hours,
+)
+from settings import ATTENDANCE_ARCHIVE_DIR, ATTENDANCE_PARTITIONS_AHEAD, ATTENDANCE_RETENTION_MONTHS, SNAPSHOT_DIR
+
+
+def cmd_rebuild_payroll_rollup(args) -> int:
+    with SessionLocal() as db:
+        rows = rebuild_payroll_rollup(db)
+        db.commit()
+    print(f"DepartmentPayrollMonthly rebuilt: {rows} department-month rows")
+    return 0
+
+
+def cmd_generate_data(args) -> int:
+    target = engine
+    if args.method == "load-data":
+        # LOAD DATA LOCAL INFILE must be allowed on the client side too
+        target = create_engine(DATABASE_URL, connect_args={"local_infile": True})
+    if args.create_schema:
+        Base.metadata.create_all(target)
+    counts = datagen.run(
+        target, args.method, args.out_dir, args.chunk_size,
+        departments=args.departments, employees=args.employees, start=args.start, end=args.end,
+        seed=args.seed, absence_rate=args.absence_rate, late_rate=args.late_rate,
+    )
+    if args.method != "csv":
+        # Rows went in over raw connections, which bump no TableVersion: retire cached API responses
+        with engine.begin() as conn:
+            bump_table_versions(conn, CACHED_TABLES & set(datagen.TABLES))
+        with SessionLocal() as db:
+            counts["DepartmentPayrollMonthly"] = rebuild_payroll_rollup(db)
+            db.commit()
+    print(json.dumps(counts))
+    return 0
+
+
+def cmd_worked_hours(args) -> int:
+    with SessionLocal() as db:
+        result = {"counted": count_worked_hours(db, args.through, incremental=not args.full)}
+        if args.reviews:
+            result.update(sync_review_hours(db, args.reviews == "prefill", args.start, args.end))
+        db.commit()
+    print(json.dumps(result))
+    # validate exits non-zero on mismatches, so it can gate a scheduled job
+    return 1 if args.reviews == "validate" and result["mismatchCount"] else 0
+
+
+def cmd_attendance_partitions(args) -> int:
+    result = {}
+    with engine.connect() as conn:
+        if conn.dialect.name == "mysql":
+            if args.convert:
+                result["converted"] = archive.convert(conn, args.ahead, args.today)
+            result["created"] = archive.ensure_partitions(conn, args.ahead, args.today)
+        elif args.convert:
+            raise SystemExit("partitioning needs MySQL; --convert is not available on " + conn.dialect.name)
+        if args.retention_months:
+            cutoff = archive.add_months(archive.month_start(args.today), -args.retention_months)
+            written = archive.archive_before(conn, args.archive_dir, cutoff)
+            if written:
+                bump_table_versions(conn, {"Attendance"})
+                conn.commit()
+            result["archived"] = {m.isoformat()[:7]: n for m, n in written.items()}
+    print(json.dumps(result))
+    return 0
+
+
+def cmd_snapshot_export(args) -> int:
+    # Point --database-url at a read replica to keep the export itself off the primary
+    source = create_engine(args.database_url) if args.database_url else engine
+    for dataset in args.datasets or list(snapshots.DATASETS):
+        print(json.dumps(snapshots.export(source, args.dir, dataset, args.through, args.full, args.format)))
+    return 0
+
+
+def cmd_snapshot_query(args) -> int:
+    table = snapshots.query(
+        args.dir, args.dataset, args.start, args.end, args.where, args.columns,
+        args.group_by, args.agg, args.order_by, args.desc, args.limit,
+    )
+    if args.output == "json":
+        for row in table.to_pylist():
+            print(json.dumps(row, default=str))
+    else:
+        import pyarrow.csv
+        pyarrow.csv.write_csv(table, sys.stdout.buffer)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="HRIS maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-payroll-rollup",
+        help="recompute the department/month payroll rollup from the Payroll table",
+    )
+    rebuild.set_defaults(func=cmd_rebuild_payroll_rollup)
+
+    generate = commands.add_parser(
+        "generate-data",
+        help="append synthetic departments, employees, attendance, payroll and reviews",
+    )
+    generate.add_argument("--departments", type=int, default=12)
+    generate.add_argument("--employees", type=int, default=1000)
+    generate.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1))
+    generate.add_argument("--end", type=date.fromisoformat, default=date(2024, 12, 31))
+    generate.add_argument("--seed", type=int, default=42, help="same seed + same options = same data")
+    generate.add_argument("--absence-rate", type=float, default=0.04, help="share of weekdays with no record")
+    generate.add_argument("--late-rate", type=float, default=0.12, help="share of arrivals after 09:00")
+    generate.add_argument("--method", choices=("insert", "load-data", "csv"), default="insert",
+                          help="multi-row INSERTs, CSV + LOAD DATA LOCAL INFILE (MySQL), or only write CSVs")
+    generate.add_argument("--out-dir", default="generated", help="CSV directory for load-data/csv")
+    generate.add_argument("--chunk-size", type=int, default=5000, help="rows per INSERT batch")
+    generate.add_argument("--create-schema", action="store_true", help="create missing tables first")
+    generate.set_defaults(func=cmd_generate_data)
+
+    worked = commands.add_parser(
+        "worked-hours",
+        help="fold Attendance into EmployeeWorkedMonthly, then optionally check or prefill review WorkingHours",
+    )
+    worked.add_argument("--full", action="store_true", help="recount everything instead of only the months that changed since the last run")
+    worked.add_argument("--through", type=date.fromisoformat, help="last day to count (default: yesterday)")
+    worked.add_argument("--reviews", choices=("validate", "prefill"),
+                        help="compare PerformanceReview.WorkingHours with attendance, or overwrite the ones that differ")
+    worked.add_argument("--start", type=date.fromisoformat, help="only reviews dated on/after this day")
+    worked.add_argument("--end", type=date.fromisoformat, help="only reviews dated on/before this day")
+    worked.set_defaults(func=cmd_worked_hours)
+
+    partitions = commands.add_parser(
+        "attendance-partitions",
+        help="create upcoming monthly Attendance partitions and archive months past the retention window",
+    )
+    partitions.add_argument("--convert", action="store_true",
+                            help="partition an existing unpartitioned Attendance table first (MySQL)")
+    partitions.add_argument("--ahead", type=int, default=ATTENDANCE_PARTITIONS_AHEAD,
+                            help="months after the current one that must already have a partition")
+    partitions.add_argument("--retention-months", type=int, default=ATTENDANCE_RETENTION_MONTHS,
+                            help="whole months kept before the current one; 0 = archive nothing")
+    partitions.add_argument("--archive-dir", default=ATTENDANCE_ARCHIVE_DIR, help="where the .csv.gz archives go")
+    partitions.add_argument("--today", type=date.fromisoformat, default=date.today(), help=argparse.SUPPRESS)
+    partitions.set_defaults(func=cmd_attendance_partitions)
+
+    export = commands.add_parser(
+        "snapshot-export",
+        help="append Payroll/Attendance/PerformanceReview rows to columnar snapshot files (needs pyarrow)",
+    )
+    export.add_argument("--dataset", dest="datasets", action="append", choices=list(snapshots.DATASETS),
+                        help="repeatable; default: all of them")
+    export.add_argument("--dir", default=SNAPSHOT_DIR)
+    export.add_argument("--through", type=date.fromisoformat, default=date.today() - timedelta(days=1),
+                        help="last day to include (default: yesterday)")
+    export.add_argument("--full", action="store_true", help="rewrite the dataset instead of appending new days")
+    export.add_argument("--format", choices=("arrow", "parquet"), default="arrow",
+                        help="arrow = uncompressed IPC, memory-mapped when queried; parquet = zstd, smaller")
+    export.add_argument("--database-url", help="read from this database instead of HRIS_DATABASE_URL")
+    export.set_defaults(func=cmd_snapshot_export)
+
+    query = commands.add_parser("snapshot-query", help="filter/aggregate a snapshot locally, print CSV or JSON lines")
+    query.add_argument("dataset", choices=list(snapshots.DATASETS))
+    query.add_argument("--dir", default=SNAPSHOT_DIR)
+    query.add_argument("--start", type=date.fromisoformat, help="first day (only the months in range are read)")
+    query.add_argument("--end", type=date.fromisoformat, help="last day")
+    query.add_argument("--where", action="append", default=[], help='e.g. "department=Sales", "netPay>=20000000"')
+    query.add_argument("--columns", nargs="+", help="columns to print when not aggregating")
+    query.add_argument("--group-by", nargs="+", default=[])
+    query.add_argument("--agg", action="append", default=[],
+                       help=f"<column>:<{'|'.join(snapshots.AGGREGATES)}>, repeatable")
+    query.add_argument("--order-by")
+    query.add_argument("--desc", action="store_true")
+    query.add_argument("--limit", type=int)
+    query.add_argument("--output", choices=("csv", "json"), default="csv")
+    query.set_defaults(func=cmd_snapshot_query)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+# Columnar analytics snapshots: Payroll, Attendance and PerformanceReview denormalized with
+# employee/department names (as in /payrolls/summary), written as month-partitioned
+# Arrow IPC or Parquet files so ad-hoc aggregations run on a laptop instead of on the OLTP database.
+#   <dir>/<dataset>/month=YYYY-MM/part-<from>_<through>.arrow
+# Driven by `python manage.py snapshot-export` / `snapshot-query`; needs `pip install pyarrow`.
+import json
+import os
+import re
+import shutil
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import text
+
+STATE_FILE = "_state.json"
+BATCH_ROWS = 50000
+EXTENSIONS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+# dataset -> (date column, its SQL source, [(column, type)], SELECT)
+_PEOPLE = """JOIN Employee e ON e.EmployeeID = t.EmployeeID
+    LEFT JOIN Department d ON d.DepartmentID = e.DepartmentID"""
+DATASETS = {
+    "payroll": ("payDate", "t.PayDate", [
+        ("payrollId", "int32"), ("employeeId", "int32"), ("name", "string"), ("department", "string"),
+        ("salary", "float64"), ("bonus", "float64"), ("deduction", "float64"), ("netPay", "float64"),
+        ("payDate", "date32"),
+    ], f"""SELECT t.PayrollID, t.EmployeeID, e.FirstName, e.LastName, d.DeptName,
+           t.Salary, t.Bonus, t.Deduction, t.PayDate AS day
+    FROM Payroll t {_PEOPLE}"""),
+    "attendance": ("date", "t.Date", [
+        ("attendanceId", "int32"), ("employeeId", "int32"), ("name", "string"), ("department", "string"),
+        ("date", "date32"), ("timeIn", "time32"), ("timeOut", "time32"), ("workedSeconds", "int32"),
+    ], f"""SELECT t.AttendanceID, t.EmployeeID, e.FirstName, e.LastName, d.DeptName,
+           t.Date AS day, t.timeIn, t.timeOut
+    FROM Attendance t {_PEOPLE}"""),
+    "performance_review": ("reviewDate", "t.ReviewDate", [
+        ("reviewId", "int32"), ("employeeId", "int32"), ("name", "string"), ("department", "string"),
+        ("score", "int32"), ("comments", "string"), ("workingHours", "int32"), ("reviewDate", "date32"),
+    ], f"""SELECT t.ReviewID, t.EmployeeID, e.FirstName, e.LastName, d.DeptName,
+           t.Score, t.Comments, t.WorkingHours, t.ReviewDate AS day
+    FROM PerformanceReview t {_PEOPLE}"""),
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise SystemExit("snapshots need pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def _schema(pa, dataset: str):
+    types = {"int32": pa.int32(), "float64": pa.float64(), "string": pa.string(),
+             "date32": pa.date32(), "time32": pa.time32("s")}
+    return pa.schema([(name, types[kind]) for name, kind in DATASETS[dataset][2]])
+
+
+# --- CONVERSION ---
+def _day(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def _seconds(value):
+    # pymysql returns TIME as timedelta, SQLite as "HH:MM:SS[.ffffff]" text
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    h, m, s = str(value)[:8].split(":")
+    return int(h) * 3600 + int(m) * 60 + int(s)
+
+
+def _money(value) -> float:
+    return float(value or Decimal(0))
+
+
+def _record(dataset: str, r, day: date) -> tuple:
+    name, department = f"{r.FirstName} {r.LastName}", r.DeptName or "Unknown"
+    if dataset == "payroll":
+        salary, bonus, deduction = _money(r.Salary), _money(r.Bonus), _money(r.Deduction)
+        return (r.PayrollID, r.EmployeeID, name, department, salary, bonus, deduction,
+                salary + bonus - deduction, day)
+    if dataset == "attendance":
+        time_in, time_out = _seconds(r.timeIn), _seconds(r.timeOut)
+        worked = time_out - time_in if time_in is not None and time_out is not None and time_out > time_in else None
+        return (r.AttendanceID, r.EmployeeID, name, department, day, time_in, time_out, worked)
+    return (r.ReviewID, r.EmployeeID, name, department, r.Score, r.Comments, r.WorkingHours, day)
+
+
+# --- EXPORT ---
+def load_state(root: str) -> dict:
+    path = os.path.join(root, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(root: str, state: dict) -> None:
+    tmp = os.path.join(root, STATE_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, os.path.join(root, STATE_FILE))
+
+
+class _MonthWriter:
+    """One open part file at a time; rows arrive ordered by date, so months come one after another."""
+
+    def __init__(self, pa, schema, directory: str, fmt: str, part: str):
+        self.pa, self.schema, self.directory, self.fmt, self.part = pa, schema, directory, fmt, part
+        self.month = None
+        self.writer = None
+        self.tmp = None
+        self.files = []
+
+    def write(self, month: str, rows: list) -> None:
+        if month != self.month:
+            self.close()
+            self.month = month
+            folder = os.path.join(self.directory, f"month={month}")
+            os.makedirs(folder, exist_ok=True)
+            path = os.path.join(folder, self.part + EXTENSIONS[self.fmt])
+            self.tmp = os.path.join(folder, f".{self.part}.tmp")  # dot files are skipped by readers
+            if self.fmt == "parquet":
+                import pyarrow.parquet as pq
+                self.writer = pq.ParquetWriter(self.tmp, self.schema, compression="zstd")
+            else:
+                # Uncompressed IPC so readers can memory-map the buffers without copying
+                self.writer = self.pa.ipc.new_file(self.tmp, self.schema)
+            self.files.append(path)
+        columns = list(zip(*rows))
+        arrays = [self.pa.array(col, type=field.type) for col, field in zip(columns, self.schema)]
+        self.writer.write_batch(self.pa.record_batch(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(self.tmp, self.files[-1])
+            self.writer = None
+
+
+def export(engine, root: str, dataset: str, through: date, full: bool = False, fmt: str = "arrow") -> dict:
+    """Append rows dated after the last export up to `through` (everything with `full`)."""
+    pa = _pyarrow()
+    os.makedirs(root, exist_ok=True)
+    state = load_state(root)
+    previous = state.get(dataset)
+    directory = os.path.join(root, dataset)
+    since = None
+    if previous and not full:
+        if previous["format"] != fmt:
+            raise SystemExit(f"{dataset} is stored as {previous['format']}; pass --full to rewrite it as {fmt}")
+        since = date.fromisoformat(previous["through"])
+        if since >= through:
+            return {"dataset": dataset, "from": previous["through"], "through": previous["through"], "rows": 0, "files": []}
+        _drop_uncommitted(directory, since)
+    elif os.path.isdir(directory):
+        shutil.rmtree(directory)
+
+    _, source, _, sql = DATASETS[dataset]
+    sql += f"\n    WHERE {source} <= :through" + (f" AND {source} > :since" if since else "") + f"\n    ORDER BY {source}"
+    part = f"part-{(since + timedelta(days=1)).isoformat() if since else 'all'}_{through.isoformat()}"
+    writer = _MonthWriter(pa, _schema(pa, dataset), directory, fmt, part)
+    rows, total, month = [], 0, None
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=BATCH_ROWS).execute(text(sql), {"through": through, "since": since})
+        for r in result:
+            day = _day(r.day)
+            record_month = f"{day:%Y-%m}"
+            if rows and (record_month != month or len(rows) >= BATCH_ROWS):
+                writer.write(month, rows)
+                total += len(rows)
+                rows = []
+            month = record_month
+            rows.append(_record(dataset, r, day))
+    if rows:
+        writer.write(month, rows)
+        total += len(rows)
+    writer.close()
+    state[dataset] = {
+        "format": fmt,
+        "through": through.isoformat(),
+        "rows": (previous["rows"] if previous and since else 0) + total,
+        "exportedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    save_state(root, state)
+    return {"dataset": dataset, "from": since.isoformat() if since else None, "through": through.isoformat(),
+            "rows": total, "files": [os.path.relpath(f, root) for f in writer.files]}
+
+
+def _drop_uncommitted(directory: str, since: date) -> None:
+    # Parts from a run that died before updating the state start after the watermark
+    pattern = re.compile(r"part-(\d{4}-\d{2}-\d{2})_")
+    for folder, _, files in os.walk(directory):
+        for name in files:
+            m = pattern.match(name)
+            if name.startswith(".") or (m and date.fromisoformat(m.group(1)) > since):
+                os.remove(os.path.join(folder, name))
+
+
+# --- QUERY ---
+FILTER = re.compile(r"^(\w+)\s*(>=|<=|!=|=|>|<)\s*(.*)$")
+AGGREGATES = ("sum", "mean", "min", "max", "count", "count_distinct")
+
+
+def open_dataset(root: str, dataset: str):
+    pa = _pyarrow()
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    info = load_state(root).get(dataset)
+    if info is None:
+        raise SystemExit(f"no {dataset} snapshot in {root}; run snapshot-export first")
+    return ds.dataset(
+        os.path.join(root, dataset),
+        schema=_schema(pa, dataset).append(pa.field("month", pa.string())),
+        format="ipc" if info["format"] == "arrow" else "parquet",
+        partitioning="hive",
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+        exclude_invalid_files=True,
+    )
+
+
+def _typed(field, raw: str):
+    kind = str(field.type)
+    if kind.startswith("int"):
+        return int(raw)
+    if kind == "double":
+        return float(raw)
+    if kind.startswith("date"):
+        return date.fromisoformat(raw)
+    return raw
+
+
+def query(root: str, dataset: str, start: date = None, end: date = None, where=(), columns=None,
+          group_by=(), aggregates=(), order_by=None, descending: bool = False, limit: int = None):
+    """Filter (pruned to the month partitions in range), optionally group/aggregate; returns a pyarrow Table.
+
+    `where` items look like "department=Sales" or "netPay>=20000000";
+    `aggregates` items look like "netPay:sum" or "employeeId:count_distinct".
+    """
+    import pyarrow.dataset as ds
+    data = open_dataset(root, dataset)
+    date_column = DATASETS[dataset][0]
+    conditions = []
+    if start:
+        conditions += [ds.field("month") >= start.isoformat()[:7], ds.field(date_column) >= start]
+    if end:
+        conditions += [ds.field("month") <= end.isoformat()[:7], ds.field(date_column) <= end]
+    for item in where:
+        m = FILTER.match(item)
+        if not m or m.group(1) not in data.schema.names:
+            raise SystemExit(f"bad filter {item!r}; expected <column><op><value> with op one of = != > >= < <=")
+        name, op, raw = m.groups()
+        field, value = ds.field(name), _typed(data.schema.field(name), raw)
+        conditions.append({"=": field == value, "!=": field != value, ">": field > value,
+                           ">=": field >= value, "<": field < value, "<=": field <= value}[op])
+    condition = None
+    for c in conditions:
+        condition = c if condition is None else condition & c
+
+    specs = []
+    for item in aggregates:
+        name, _, fn = item.partition(":")
+        if name not in data.schema.names or fn not in AGGREGATES:
+            raise SystemExit(f"bad aggregate {item!r}; expected <column>:<{'|'.join(AGGREGATES)}>")
+        specs.append((name, fn))
+    if specs or group_by:
+        needed = set(group_by) | {name for name, _ in specs}
+    else:
+        needed = set(columns or data.schema.names)
+    table = data.to_table(columns=[n for n in data.schema.names if n in needed], filter=condition)
+    if specs or group_by:
+        table = table.group_by(list(group_by)).aggregate(specs or [(group_by[0], "count")])
+    if order_by:
+        table = table.sort_by([(order_by, "descending" if descending else "ascending")])
+    if limit is not None:
+        table = table.slice(0, limit)
+    return table
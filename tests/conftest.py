@@ -0,0 +1,50 @@
+# Shared setup: the real app on a temporary SQLite database, with authentication overridden.
+# Run from the repository root: python -m pytest tests
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+DB = os.path.join(tempfile.mkdtemp(prefix="hris-test-"), "test.db")
+# settings.py reads these at import time, so they must be set before main is imported
+os.environ["HRIS_DATABASE_URL"] = "sqlite:///" + DB
+os.environ["HRIS_ASYNC_DATABASE_URL"] = "sqlite+aiosqlite:///" + DB
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+USER = SimpleNamespace(UserID=None, Username="test")
+
+
+@pytest.fixture()
+def client():
+    main.Base.metadata.drop_all(main.engine)
+    main.Base.metadata.create_all(main.engine)
+    # Process-wide state that would outlive the dropped tables (table versions restart at 0)
+    main.response_cache.backend.clear()
+    main.employee_search.reload()
+    main.app.dependency_overrides[main.get_current_active_user] = lambda: USER
+    main.app.dependency_overrides[main.get_audited_user] = lambda: USER
+    try:
+        yield TestClient(main.app)
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def staff(client):
+    """Departments 1-2 and three employees: two in Engineering, one in Sales."""
+    for name in ("Engineering", "Sales"):
+        assert client.post("/departments/", json={"DeptName": name}).status_code == 200
+    employees = []
+    for first, last, department_id in (("An", "Nguyen", 1), ("Binh", "Tran", 1), ("Chi", "Le", 2)):
+        r = client.post("/employees/", json={
+            "FirstName": first, "LastName": last, "DOB": "1990-01-01", "Phone": "0900000000",
+            "Email": f"{first.lower()}@example.com", "Gender": 1, "DepartmentID": department_id,
+        })
+        assert r.status_code == 200, r.text
+        employees.append(r.json())
+    return employees
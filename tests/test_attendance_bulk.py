@@ -0,0 +1,54 @@
+# POST /attendances/bulk: per-row results, insert vs update, and rejected rows that do not block the rest.
+from sqlalchemy import select
+
+import main
+
+
+def attendance() -> dict:
+    with main.SessionLocal() as db:
+        rows = db.execute(select(main.Attendance.EmployeeID, main.Attendance.Date,
+                                 main.Attendance.timeIn, main.Attendance.timeOut))
+        return {(r.EmployeeID, r.Date.isoformat()): (str(r.timeIn), str(r.timeOut)) for r in rows}
+
+
+def test_insert_update_and_reject_counts(client, staff):
+    an, binh = staff[0]["EmployeeID"], staff[1]["EmployeeID"]
+    r = client.post("/attendances/bulk", json=[
+        {"EmployeeID": an, "Date": "2025-05-12", "timeIn": "08:00", "timeOut": None},
+        {"EmployeeID": binh, "Date": "2025-05-12", "timeIn": "08:30:00", "timeOut": "17:00:00"},
+        {"EmployeeID": 999, "Date": "2025-05-12", "timeIn": "08:00:00", "timeOut": "17:00:00"},
+        {"EmployeeID": an, "Date": "2025-05-13", "timeIn": "09:00:00", "timeOut": "08:00:00"},
+        {"EmployeeID": an, "Date": "not a date", "timeIn": "09:00:00", "timeOut": None},
+    ])
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["received"], body["inserted"], body["updated"], body["rejected"]) == (5, 2, 0, 3)
+    assert [row["status"] for row in body["results"]] == ["inserted", "inserted", "rejected", "rejected", "rejected"]
+    assert body["results"][2]["error"] == "Employee not found"
+
+    # A later clock-out fills in timeOut and keeps the first clock-in
+    r = client.post("/attendances/bulk", json=[
+        {"EmployeeID": an, "Date": "2025-05-12", "timeIn": "08:45:00", "timeOut": "17:30:00"},
+        {"EmployeeID": an, "Date": "2025-05-14", "timeIn": "08:00:00", "timeOut": "16:00:00"},
+    ])
+    body = r.json()
+    assert (body["inserted"], body["updated"], body["rejected"]) == (1, 1, 0)
+    assert attendance() == {
+        (an, "2025-05-12"): ("08:00:00", "17:30:00"),
+        (binh, "2025-05-12"): ("08:30:00", "17:00:00"),
+        (an, "2025-05-14"): ("08:00:00", "16:00:00"),
+    }
+
+
+def test_csv_upload_with_duplicate_rows_in_one_batch(client, staff):
+    an = staff[0]["EmployeeID"]
+    csv_body = (
+        "EmployeeID,Date,timeIn,timeOut\n"
+        f"{an},2025-05-12,08:00,\n"
+        f"{an},2025-05-12,,17:00\n"
+    )
+    r = client.post("/attendances/bulk", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["inserted"], body["updated"], body["rejected"]) == (1, 1, 0)
+    assert attendance() == {(an, "2025-05-12"): ("08:00:00", "17:00:00")}
@@ -0,0 +1,74 @@
+# Audit writer: every admitted write reserves a buffer slot, and requests that record nothing give it back.
+import contextvars
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+@pytest.fixture()
+def audited(client, monkeypatch):
+    # The real get_audited_user, which reserves the slot (authentication stays overridden)
+    del main.app.dependency_overrides[main.get_audited_user]
+    monkeypatch.setattr(main.audit_log, "flush_seconds", 0.05)
+    return client
+
+
+def flushed(timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while main.audit_log.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return main.audit_log.stats()
+
+
+def test_reservation_released_after_404_and_rollback(audited, staff):
+    before = flushed()
+    assert audited.put("/departments/999", json={"DeptName": "Nope"}).status_code == 404
+    assert main.audit_log.reserved == 0
+
+    account = {"adminID": 1, "Username": "lan", "password": "secret123"}
+    assert audited.post("/user_accounts/", json=account).status_code == 200
+    # Duplicate username: the commit fails and the handler rolls back
+    assert audited.post("/user_accounts/", json={**account, "adminID": 2}).status_code == 400
+    assert main.audit_log.reserved == 0
+
+    # A no-op update records nothing and gives its slot back too
+    assert audited.put("/departments/1", json={"DeptName": "Engineering"}).status_code == 200
+    assert main.audit_log.reserved == 0
+
+    after = flushed()
+    assert after["written"] == before["written"] + 1
+    entries = audited.get("/audit/", params={"table_name": "UserAccount"}).json()
+    assert [(e["ActionType"], e["Changes"]["password"]) for e in entries] == [("INSERT", [None, "***"])]
+
+
+def test_bulk_upload_records_one_entry_per_changed_row(audited, staff):
+    before = flushed()
+    r = audited.post("/attendances/bulk", json=[
+        {"EmployeeID": staff[0]["EmployeeID"], "Date": "2025-05-12", "timeIn": "08:00:00", "timeOut": None},
+        {"EmployeeID": staff[1]["EmployeeID"], "Date": "2025-05-12", "timeIn": "08:00:00", "timeOut": None},
+        {"EmployeeID": 999, "Date": "2025-05-12", "timeIn": "08:00:00", "timeOut": None},
+    ])
+    assert r.json()["inserted"] == 2
+    assert main.audit_log.reserved == 0
+    assert flushed()["written"] == before["written"] + 2
+
+
+def test_reservations_count_against_capacity():
+    writer = main.AuditLogWriter(capacity=2, batch_size=10, flush_seconds=5, admit_timeout=0.05)
+    request = contextvars.copy_context()
+    request.run(writer.admit_blocking, 2)
+    assert writer.reserved == 2 and writer.pending == 0
+
+    # Nothing is buffered yet, but both slots are promised: the next write is held back
+    with pytest.raises(HTTPException) as exc:
+        contextvars.copy_context().run(writer.admit_blocking, 1)
+    assert exc.value.status_code == 503 and writer.rejected == 1
+
+    reservation = request.run(main.current_audit_reservation.get)
+    writer.release(reservation)
+    assert writer.reserved == 0 and reservation.slots == 0
+    contextvars.copy_context().run(writer.admit_blocking, 1)
+    assert writer.reserved == 1
@@ -0,0 +1,42 @@
+# GET /employees/search: prefix/substring matching over the in-memory n-gram index, kept current by writes.
+def ids(response) -> list:
+    assert response.status_code == 200, response.text
+    return [hit["EmployeeID"] for hit in response.json()]
+
+
+def test_prefix_substring_and_all_terms(client, staff):
+    an, binh, chi = (e["EmployeeID"] for e in staff)
+    assert ids(client.get("/employees/search", params={"q": "bi"})) == [binh]
+    assert ids(client.get("/employees/search", params={"q": "guye"})) == [an]  # substring of Nguyen
+    assert ids(client.get("/employees/search", params={"q": "chi@example.com"})) == [chi]
+    assert ids(client.get("/employees/search", params={"q": "an tran"})) == []
+    assert ids(client.get("/employees/search", params={"q": "binh tran"})) == [binh]
+
+
+def test_ranking_and_department_filter(client, staff):
+    an, binh, chi = (e["EmployeeID"] for e in staff)
+    r = client.post("/employees/", json={
+        "FirstName": "Lan", "LastName": "Anh", "DOB": "1990-01-01", "Phone": "0900000000",
+        "Email": "lan@example.com", "Gender": 0, "DepartmentID": 2,
+    })
+    lan = r.json()["EmployeeID"]
+    # A whole first name ("An") ranks above a last-name prefix ("Anh"); "Lan" alone would not match
+    assert ids(client.get("/employees/search", params={"q": "an"}))[:2] == [an, lan]
+    assert ids(client.get("/employees/search", params={"q": "an", "department_id": 2})) == [lan]
+    assert sorted(ids(client.get("/employees/search", params={"department_id": 1}))) == [an, binh]
+
+
+def test_index_follows_updates_and_deletes(client, staff):
+    binh = staff[1]
+    r = client.put(f"/employees/{binh['EmployeeID']}", json={**binh, "LastName": "Pham"})
+    assert r.status_code == 200, r.text
+    assert ids(client.get("/employees/search", params={"q": "tran"})) == []
+    assert ids(client.get("/employees/search", params={"q": "pham"})) == [binh["EmployeeID"]]
+
+    assert client.delete(f"/employees/{binh['EmployeeID']}").status_code == 200
+    assert ids(client.get("/employees/search", params={"q": "pham"})) == []
+
+
+def test_validation(client, staff):
+    assert client.get("/employees/search").status_code == 400
+    assert client.get("/employees/search", params={"q": "an", "limit": 0}).status_code == 400
@@ -0,0 +1,34 @@
+# Conditional GET: If-None-Match answers 304 while the tagged tables are unchanged, 200 after a write.
+import main
+
+
+def test_304_until_a_write(client, staff):
+    r = client.get("/departments/")
+    etag = r.headers["ETag"]
+    assert etag.startswith('"') and r.headers["Cache-Control"] == main.CACHE_CONTROL
+
+    r = client.get("/departments/", headers={"If-None-Match": etag})
+    assert r.status_code == 304 and r.content == b""
+    assert r.headers["ETag"] == etag
+    # Weak form and lists of tags, as browsers and proxies send them
+    assert client.get("/departments/", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+    assert client.post("/departments/", json={"DeptName": "Finance"}).status_code == 200
+    r = client.get("/departments/", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+    assert "Finance" in [d["DeptName"] for d in r.json()]
+
+
+def test_etag_does_not_expire_with_the_cache_ttl(client, staff, monkeypatch):
+    etag = client.get("/departments/").headers["ETag"]
+    # Cached bodies age out; an unchanged table still revalidates
+    main.response_cache.backend.clear()
+    monkeypatch.setattr(main.time, "time", lambda: 4_000_000_000.0)
+    assert client.get("/departments/", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_etag_depends_on_the_query(client, staff):
+    a = client.get("/employees/", params={"limit": 1}).headers["ETag"]
+    b = client.get("/employees/", params={"limit": 2}).headers["ETag"]
+    assert a != b
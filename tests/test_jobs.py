@@ -0,0 +1,77 @@
+# Background jobs: one active job per type across processes (unique Job.ActiveType), status and results.
+import threading
+import time
+from datetime import datetime, timedelta
+
+import main
+
+
+def wait_until_finished(client, job_id: str, timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = client.get(f"/jobs/{job_id}").json()
+        if info["status"] in ("succeeded", "failed"):
+            return info
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} still {info['status']}")
+
+
+def test_second_submit_while_active_is_a_409(client, staff, monkeypatch):
+    release = threading.Event()
+
+    def blocking_run(job, pay_date=None):
+        job.progress(10, "waiting")
+        assert release.wait(10)
+        return {"created": 0}
+
+    monkeypatch.setitem(main.jobs.handlers, "payroll-process-next", blocking_run)
+    r = client.post("/payrolls/process-next")
+    assert r.status_code == 202, r.text
+    first = r.json()["jobId"]
+    assert r.headers["Location"] == f"/jobs/{first}"
+
+    r = client.post("/payrolls/process-next")
+    assert r.status_code == 409
+    assert r.json()["detail"]["jobId"] == first
+    assert client.get(f"/jobs/{first}/result").status_code == 409  # not finished yet
+
+    release.set()
+    info = wait_until_finished(client, first)
+    assert info["status"] == "succeeded" and info["progress"] == 100
+    assert client.get(f"/jobs/{first}/result").json() == {"created": 0}
+
+    # Finished jobs free the slot
+    r = client.post("/payrolls/process-next")
+    assert r.status_code == 202
+    assert wait_until_finished(client, r.json()["jobId"])["status"] == "succeeded"
+
+
+def test_job_of_another_process_blocks_until_its_heartbeat_goes_stale(client, staff, monkeypatch):
+    monkeypatch.setitem(main.jobs.handlers, "payroll-process-next", lambda job, pay_date=None: {"created": 0})
+    now = datetime.utcnow()
+    with main.SessionLocal() as db:
+        db.add(main.Job(JobID="a" * 32, JobType="payroll-process-next", ActiveType="payroll-process-next",
+                        Status="running", CreatedAt=now, HeartbeatAt=now))
+        db.commit()
+    r = client.post("/payrolls/process-next")
+    assert r.status_code == 409 and r.json()["detail"]["jobId"] == "a" * 32
+
+    with main.SessionLocal() as db:
+        db.get(main.Job, "a" * 32).HeartbeatAt = now - timedelta(seconds=main.JOB_STALE_SECONDS + 1)
+        db.commit()
+    r = client.post("/payrolls/process-next")
+    assert r.status_code == 202
+    abandoned = client.get(f"/jobs/{'a' * 32}").json()
+    assert abandoned["status"] == "failed" and abandoned["error"].startswith("Abandoned")
+    wait_until_finished(client, r.json()["jobId"])
+
+
+def test_failing_job_reports_its_error(client, staff, monkeypatch):
+    def broken(job, pay_date=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(main.jobs.handlers, "payroll-process-next", broken)
+    job_id = client.post("/payrolls/process-next").json()["jobId"]
+    info = wait_until_finished(client, job_id)
+    assert info["status"] == "failed" and info["error"] == "RuntimeError: boom"
+    assert client.get("/jobs/", params={"status": "failed"}).json()[0]["jobId"] == job_id
@@ -0,0 +1,122 @@
+# The incrementally maintained DepartmentPayrollMonthly must always equal a full rebuild.
+from datetime import date
+
+from sqlalchemy import select
+
+import main
+
+
+def rollup() -> list:
+    with main.SessionLocal() as db:
+        return [
+            (r.DepartmentID, r.PayMonth, r.Headcount, r.GrossTotal, r.BonusTotal, r.DeductionTotal, r.NetTotal)
+            for r in db.scalars(select(main.DepartmentPayrollMonthly).order_by(
+                main.DepartmentPayrollMonthly.DepartmentID, main.DepartmentPayrollMonthly.PayMonth))
+        ]
+
+
+def rebuilt() -> list:
+    with main.SessionLocal() as db:
+        main.rebuild_payroll_rollup(db)
+        db.flush()
+        rows = [
+            (r.DepartmentID, r.PayMonth, r.Headcount, r.GrossTotal, r.BonusTotal, r.DeductionTotal, r.NetTotal)
+            for r in db.scalars(select(main.DepartmentPayrollMonthly).order_by(
+                main.DepartmentPayrollMonthly.DepartmentID, main.DepartmentPayrollMonthly.PayMonth))
+        ]
+        db.rollback()
+    return rows
+
+
+def add_employee(client, department_id, name="An") -> dict:
+    r = client.post("/employees/", json={
+        "FirstName": name, "LastName": "Nguyen", "DOB": "1990-01-01", "Phone": "0900000000",
+        "Email": f"{name.lower()}@example.com", "Gender": 1, "DepartmentID": department_id,
+    })
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+# Payroll writes the way the /payrolls/ handlers make them (flush, record_payroll_change, commit);
+# the handlers themselves pass PayDate as a string, which only MySQL's driver accepts
+def add_payroll(employee_id, pay_date, salary=1000, bonus=0, deduction=0) -> int:
+    with main.SessionLocal() as db:
+        pay = main.Payroll(EmployeeID=employee_id, Salary=salary, Bonus=bonus, Deduction=deduction,
+                           PayDate=date.fromisoformat(pay_date))
+        db.add(pay)
+        db.flush()
+        main.record_payroll_change(db, None, main.payroll_fields(pay))
+        db.commit()
+        return pay.PayrollID
+
+
+def update_payroll(payroll_id, **values) -> None:
+    with main.SessionLocal() as db:
+        pay = db.get(main.Payroll, payroll_id)
+        before = main.payroll_fields(pay)
+        for name, value in values.items():
+            setattr(pay, name, date.fromisoformat(value) if name == "PayDate" else value)
+        db.flush()
+        main.record_payroll_change(db, before, main.payroll_fields(pay))
+        db.commit()
+
+
+def delete_payroll(payroll_id) -> None:
+    with main.SessionLocal() as db:
+        pay = db.get(main.Payroll, payroll_id)
+        before = main.payroll_fields(pay)
+        db.delete(pay)
+        db.flush()
+        main.record_payroll_change(db, before, None)
+        db.commit()
+
+
+def move(client, employee: dict, department_id) -> None:
+    r = client.put(f"/employees/{employee['EmployeeID']}", json={**employee, "DepartmentID": department_id})
+    assert r.status_code == 200, r.text
+
+
+def test_department_move_then_delete(client):
+    for name in ("Engineering", "Sales"):
+        assert client.post("/departments/", json={"DeptName": name}).status_code == 200
+    emp = add_employee(client, 1)
+    pay = add_payroll(emp["EmployeeID"], "2025-01-31")
+    move(client, emp, 2)
+    assert rollup() == rebuilt()
+
+    delete_payroll(pay)
+    assert rollup() == rebuilt() == []
+
+
+def test_department_move_then_update(client):
+    for name in ("Engineering", "Sales", "Finance"):
+        assert client.post("/departments/", json={"DeptName": name}).status_code == 200
+    emp = add_employee(client, 1)
+    other = add_employee(client, 1, "Binh")
+    pay = add_payroll(emp["EmployeeID"], "2025-01-31", 1000, 200, 50)
+    add_payroll(emp["EmployeeID"], "2025-01-15", 300)
+    add_payroll(emp["EmployeeID"], "2025-02-28", 1100)
+    add_payroll(other["EmployeeID"], "2025-01-31", 900)
+    move(client, emp, 2)
+    assert rollup() == rebuilt()
+
+    update_payroll(pay, Salary=1500, PayDate="2025-02-27")
+    assert rollup() == rebuilt()
+
+    move(client, emp, None)
+    assert rollup() == rebuilt()
+    move(client, emp, 3)
+    assert rollup() == rebuilt()
+
+
+def test_department_summary_covers_the_whole_range(client):
+    assert client.post("/departments/", json={"DeptName": "Engineering"}).status_code == 200
+    an, binh = add_employee(client, 1), add_employee(client, 1, "Binh")
+    add_payroll(an["EmployeeID"], "2025-01-31", 1000)
+    add_payroll(binh["EmployeeID"], "2025-01-31", 900)
+    add_payroll(an["EmployeeID"], "2025-02-28", 1100)
+
+    r = client.get("/payrolls/department-summary?start_month=2025-01-01&end_month=2025-02-01")
+    assert r.json() == [{"department": "Engineering", "employees": 2, "totalPay": 3000}]
+    r = client.get("/payrolls/department-summary?start_month=2025-02-01&end_month=2025-02-01")
+    assert r.json() == [{"department": "Engineering", "employees": 1, "totalPay": 1100}]
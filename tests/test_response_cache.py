@@ -0,0 +1,45 @@
+# Read-through response cache: repeat GETs are served from the cache until a write to a tagged table.
+import main
+
+
+def cache_stats() -> dict:
+    return main.response_cache.stats()
+
+
+def test_repeat_get_is_a_hit_until_a_write(client, staff):
+    first = client.get("/departments/")
+    assert first.status_code == 200
+    before = cache_stats()
+    again = client.get("/departments/")
+    assert again.content == first.content
+    assert cache_stats()["hits"] == before["hits"] + 1
+
+    assert client.put("/departments/1", json={"DeptName": "Platform"}).status_code == 200
+    fresh = client.get("/departments/")
+    assert [d["DeptName"] for d in fresh.json()] == ["Platform", "Sales"]
+    assert cache_stats()["misses"] == before["misses"] + 1
+
+
+def test_query_string_is_part_of_the_key(client, staff):
+    assert len(client.get("/departments/", params={"limit": 1}).json()) == 1
+    assert len(client.get("/departments/", params={"limit": 2}).json()) == 2
+
+
+def test_write_to_another_table_keeps_the_entry(client, staff):
+    client.get("/departments/")
+    before = cache_stats()
+    r = client.post("/attendances/bulk", json=[
+        {"EmployeeID": staff[0]["EmployeeID"], "Date": "2025-05-12", "timeIn": "08:00:00", "timeOut": "17:00:00"},
+    ])
+    assert r.json()["inserted"] == 1
+    client.get("/departments/")
+    assert cache_stats()["hits"] == before["hits"] + 1
+
+
+def test_write_from_another_session_retires_the_entry(client, staff):
+    client.get("/departments/")
+    # Not through the API: any ORM commit (a job, another worker, manage.py) bumps the version
+    with main.SessionLocal() as db:
+        db.get(main.Department, 2).DeptName = "Field Sales"
+        db.commit()
+    assert [d["DeptName"] for d in client.get("/departments/").json()] == ["Engineering", "Field Sales"]